@@ -7,11 +7,8 @@ functionality like string conversion, comparison operations, and JSON.
 
 from __future__ import annotations
 
-import copy
-import json
-from functools import total_ordering
-from typing import Any, Generic, TypeVar, Protocol, runtime_checkable
-from abc import ABC, abstractmethod
+import math
+from typing import Any, ClassVar, Generic, Optional, TypeVar, Protocol
 
 from tedium.types.core.exceptions import (
     ValidationError,
@@ -19,11 +16,15 @@ from tedium.types.core.exceptions import (
     ImmutabilityError,
 )
 
+try:
+    import orjson as _orjson
+except ImportError:  # orjson is an optional speedup
+    _orjson = None  # type: ignore[assignment]
+
 # Define return type for comparison operations
 ComparisonReturn = Any  # This represents bool | type(NotImplemented)
 
 
-@runtime_checkable
 class Comparable(Protocol):
     """Protocol for types that support comparison operations."""
     def __lt__(self, other: Any) -> ComparisonReturn: ...
@@ -33,26 +34,97 @@ class Comparable(Protocol):
 
 
 T = TypeVar("T", bound=Comparable)
+_B = TypeVar("_B", bound="BaseType[Any]")
 
 
-class BaseType(Generic[T], ABC):
+class BaseType(Generic[T]):
     """Base class for all types in the tedium type system.
 
     This class follows Python's comparison protocol by returning NotImplemented
     for operations between incompatible types, allowing Python's type machinery
     to handle the TypeError generation.
+
+    The wrapped value is exposed as-is through the read-only ``value``
+    attribute. Instances store it, and its hash computed once at construction,
+    in slots rather than a ``__dict__``. Subclasses should declare
+    ``__slots__`` as well (an empty tuple if they add no state), otherwise
+    every instance silently regains a ``__dict__``.
     """
 
-    _value: T
+    __slots__ = ("value", "_hash", "__weakref__")
+
+    value: T
+    _hash: Optional[int]
+
+    # Set by subclasses whose validate() accepts every value of exactly this
+    # type. Parsed values of that type are then wrapped without validation.
+    _exact_type: ClassVar[Optional[type]] = None
+    # The class that declared the inherited ``_exact_type``
+    _exact_owner: ClassVar[Optional[type]] = None
 
     def __init__(self, value: T) -> None:
         self.validate(value)
-        object.__setattr__(self, "_value", value)
+        _store(self, value)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Drop the inherited exact-type fast path when validation changes.
+
+        A subclass whose validate(), __init__ or __new__ differs from the one
+        the declaring class resolves, whether overridden directly or picked up
+        from a mixin, may reject values its parent accepted, so unless it
+        restates ``_exact_type`` it falls back to full validation.
+        """
+        super().__init_subclass__(**kwargs)
+        if "_exact_type" in cls.__dict__:
+            cls._exact_owner = cls
+            return
+        owner = cls._exact_owner
+        if owner is not None and any(
+            getattr(cls, name) is not getattr(owner, name) for name in ("validate", "__init__", "__new__")
+        ):
+            cls._exact_type = None
+            cls._exact_owner = None
+
+    @classmethod
+    def _unsafe_new(cls: type[_B], value: Any) -> _B:
+        """Create an instance without running validation.
+
+        Only for internal paths where the value is already known to be valid,
+        such as copies of an existing instance.
+
+        Args:
+            value: A value that has already passed validation
+
+        Returns:
+            New instance wrapping the value
+        """
+        obj = object.__new__(cls)
+        _store(obj, value)
+        return obj
+
+    @classmethod
+    def _from_parsed(cls, value: Any) -> BaseType[T]:
+        """Wrap a freshly parsed value.
+
+        Values whose type is exactly ``_exact_type`` skip validation; anything
+        else goes through the constructor.
+
+        Args:
+            value: The parsed value
+
+        Returns:
+            New instance wrapping the value
+        """
+        if type(value) is cls._exact_type:
+            return cls._unsafe_new(value)
+        return cls(value)
 
-    @abstractmethod
     def validate(self, value: T) -> None:
         """Validate the value before storing it.
 
+        Subclasses extend this with their type-specific checks and should call
+        ``super().validate(value)`` first.
+
         Args:
             value: The value to validate
 
@@ -63,43 +135,53 @@ class BaseType(Generic[T], ABC):
             raise ValidationError("Value cannot be None", value=value)
 
     @property
-    def value(self) -> T:
-        """Get the wrapped value.
-
-        The value is returned as-is without any conversion.
+    def _value(self) -> T:
+        """Read-only alias of ``value`` for code written against the old name.
 
         Returns:
             The wrapped value
         """
-        return self._value
+        return self.value
 
     def __setattr__(self, name: str, value: Any) -> None:
-        """Prevent attribute modification after initialization.
+        """Prevent attribute modification.
+
+        Initialization writes the value through the slot descriptor, so every
+        call that reaches this method is a modification attempt.
 
         Args:
             name: Attribute name
             value: New value
 
         Raises:
-            ImmutabilityError: If attempting to modify after initialization
+            ImmutabilityError: Always
         """
-        # Allow setting _value during initialization
-        if name == "_value" and not hasattr(self, "_value"):
-            super().__setattr__(name, value)
-            return
-
         raise ImmutabilityError(
             f"Cannot modify {name} after initialization",
             attribute=name
         )
 
+    def __delattr__(self, name: str) -> None:
+        """Prevent attribute deletion.
+
+        Args:
+            name: Attribute name
+
+        Raises:
+            ImmutabilityError: Always
+        """
+        raise ImmutabilityError(
+            f"Cannot delete {name} after initialization",
+            attribute=name
+        )
+
     def __str__(self) -> str:
         """Convert to string representation.
 
         Returns:
             String representation of the value
         """
-        return str(self._value)
+        return str(self.value)
 
     def __repr__(self) -> str:
         """Get detailed string representation.
@@ -107,7 +189,7 @@ class BaseType(Generic[T], ABC):
         Returns:
             Detailed string showing type and value
         """
-        return f"{self.__class__.__name__}({repr(self._value)})"
+        return f"{self.__class__.__name__}({repr(self.value)})"
 
     def __eq__(self, other: Any) -> bool:
         """Check if this type equals another value.
@@ -123,7 +205,7 @@ class BaseType(Generic[T], ABC):
         """
         if not isinstance(other, type(self)):
             return NotImplemented
-        return bool(self._value == other._value)
+        return bool(self.value == other.value)
 
     def __lt__(self, other: Any) -> ComparisonReturn:
         """Compare if this value is less than another value.
@@ -138,39 +220,39 @@ class BaseType(Generic[T], ABC):
         """
         if not isinstance(other, type(self)):
             return NotImplemented
-        return self._value < other._value
+        return self.value < other.value
 
     def __gt__(self, other: Any) -> bool:
         """Compare if this value is greater than another value."""
-        if self.__class__ is BaseType:
-            return NotImplemented
         if not isinstance(other, type(self)):
             return NotImplemented
-        return bool(self._value > other._value)
+        return bool(self.value > other.value)
 
     def __le__(self, other: Any) -> bool:
         """Compare if this value is less than or equal to another value."""
-        if self.__class__ is BaseType:
-            return NotImplemented
         if not isinstance(other, type(self)):
             return NotImplemented
-        return bool(self._value <= other._value)
+        return bool(self.value <= other.value)
 
     def __ge__(self, other: Any) -> bool:
         """Compare if this value is greater than or equal to another value."""
-        if self.__class__ is BaseType:
-            return NotImplemented
         if not isinstance(other, type(self)):
             return NotImplemented
-        return bool(self._value >= other._value)
+        return bool(self.value >= other.value)
 
     def __hash__(self) -> int:
         """Get hash value for use in sets and as dict keys.
 
         Returns:
             Hash of the wrapped value
+
+        Raises:
+            TypeError: If the wrapped value is unhashable
         """
-        return hash(self._value)
+        h = self._hash
+        if h is None:
+            return hash(self.value)
+        return h
 
     def to_json(self) -> str:
         """Convert the value to a JSON string.
@@ -178,7 +260,7 @@ class BaseType(Generic[T], ABC):
         Returns:
             JSON string representation
         """
-        return json.dumps(self._value)
+        return _dumps(self.value)
 
     @classmethod
     def from_json(cls, json_str: str) -> BaseType[T]:
@@ -194,15 +276,15 @@ class BaseType(Generic[T], ABC):
             ConversionError: If the JSON string cannot be parsed
         """
         try:
-            value = json.loads(json_str)
-            return cls(value)
-        except json.JSONDecodeError as e:
+            value = _loads(json_str)
+        except ValueError as e:  # json.JSONDecodeError
             raise ConversionError(
                 "Invalid JSON string",
                 value=json_str,
                 target_type=cls,
                 error=str(e)
             ) from e
+        return cls._from_parsed(value)
 
     def __copy__(self) -> BaseType[T]:
         """Create a shallow copy.
@@ -210,7 +292,7 @@ class BaseType(Generic[T], ABC):
         Returns:
             New instance with the same value
         """
-        return self.__class__(self._value)
+        return self._unsafe_new(self.value)
 
     def __deepcopy__(self, memo: dict[int, Any]) -> BaseType[T]:
         """Create a deep copy.
@@ -221,33 +303,103 @@ class BaseType(Generic[T], ABC):
         Returns:
             New instance with a deep copy of the value
         """
-        return self.__class__(copy.deepcopy(self._value, memo))
+        from copy import deepcopy
 
+        return self._unsafe_new(deepcopy(self.value, memo))
 
-@total_ordering
-class ComparableType(BaseType[T]):
-    """Base class for types that support comparison operations."""
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling without re-running the constructor.
 
-    def __lt__(self, other: Any) -> Any:
-        """Compare if this value is less than another value."""
-        if not isinstance(other, type(self)):
-            return NotImplemented
-        return self._value < other._value
+        Slotted instances are otherwise restored with ``setattr``, which the
+        immutability guard rejects, and subclass constructors may require more
+        than the value. The instance ``__dict__`` of subclasses without
+        ``__slots__`` is restored as state.
 
-    def __gt__(self, other: Any) -> bool:
-        """Compare if this value is greater than another value."""
-        if not isinstance(other, type(self)):
-            return NotImplemented
-        return bool(self._value > other._value)
+        Returns:
+            Callable, arguments and state used to recreate the instance
+        """
+        return (type(self)._unsafe_new, (self.value,), getattr(self, "__dict__", None))
 
-    def __le__(self, other: Any) -> bool:
-        """Compare if this value is less than or equal to another value."""
-        if not isinstance(other, type(self)):
-            return NotImplemented
-        return bool(self._value <= other._value)
 
-    def __ge__(self, other: Any) -> bool:
-        """Compare if this value is greater than or equal to another value."""
-        if not isinstance(other, type(self)):
-            return NotImplemented
-        return bool(self._value >= other._value)
+def _dumps(value: Any) -> str:
+    """Serialize a value to JSON, using orjson when it is installed.
+
+    orjson is only used for top-level scalars, since it diverges from the
+    standard library on non-finite floats (it writes ``null``) and integers
+    wider than 64 bits, including inside containers. Everything else goes
+    through the standard library.
+    """
+    if _orjson is not None and _is_fast_scalar(value):
+        try:
+            return _orjson.dumps(value).decode()
+        except TypeError:
+            pass
+    import json
+
+    return json.dumps(value)
+
+
+def _loads(json_str: str) -> Any:
+    """Parse a JSON string, using orjson when it is installed.
+
+    The backend is picked from the first character: orjson only sees input
+    that starts like a string, number or literal. Containers, which may nest
+    values orjson reads differently, and anything else go straight to the
+    standard library, which also produces the canonical ``JSONDecodeError``
+    for invalid input. orjson rejects ``NaN``/``Infinity`` and parses integers
+    wider than 64 bits as floats; those rare inputs are re-parsed.
+    """
+    if _orjson is not None and json_str[:1] in _ORJSON_START:
+        try:
+            value = _orjson.loads(json_str)
+        except _orjson.JSONDecodeError:
+            pass
+        else:
+            if type(value) is not float or not value.is_integer():
+                return value
+            if "." in json_str or "e" in json_str or "E" in json_str:
+                return value
+    import json
+
+    return json.loads(json_str)
+
+
+def _is_fast_scalar(value: Any) -> bool:
+    """Return whether orjson and the standard library agree on a value."""
+    if value is None or type(value) in (int, str, bool):
+        return True
+    return type(value) is float and math.isfinite(value)
+
+
+# First characters of JSON input that _loads hands to orjson
+_ORJSON_START = frozenset('"-0123456789tfn')
+
+
+# Slot setters, bound once so that construction stores state without going
+# through the immutability guard in ``__setattr__``.
+_set_value = BaseType.__dict__["value"].__set__
+_set_hash = BaseType.__dict__["_hash"].__set__
+
+
+def _store(obj: BaseType[Any], value: Any) -> None:
+    """Store an already validated value and its hash on a new instance.
+
+    Unhashable values get a ``None`` hash, which makes ``__hash__`` re-raise
+    the original ``TypeError`` on use.
+    """
+    _set_value(obj, value)
+    try:
+        h: Optional[int] = hash(value)
+    except TypeError:
+        h = None
+    _set_hash(obj, h)
+
+
+class ComparableType(BaseType[T]):
+    """Base class for types that support comparison operations.
+
+    The ordering operators are inherited from BaseType; this class remains as
+    an explicit marker for ordered types.
+    """
+
+    __slots__ = ()
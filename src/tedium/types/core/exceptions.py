@@ -5,58 +5,108 @@ All custom exceptions inherit from TypeSystemError to allow catching all
 type-related errors with a single except clause.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+
+
+def _merge_context(_context: Optional[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine context handed up by a subclass with caller-supplied context.
+
+    The ``**context`` dict is freshly built for each call, so it is reused
+    rather than copied; the whole hierarchy shares one dict per exception.
+    """
+    if _context is None:
+        return context
+    if context:
+        _context.update(context)
+    return _context
+
+
+def _rebuild(cls: type, args: Tuple[Any, ...]) -> BaseException:
+    """Create an exception instance for unpickling without calling __init__."""
+    exc: BaseException = cls.__new__(cls, *args)
+    exc.args = args
+    return exc
 
 
 class TypeSystemError(Exception):
     """Base exception for all type system errors."""
 
+    __slots__ = ("context",)
+
     context: Dict[str, Any]
 
-    def __init__(self, message: str, **context: Any) -> None:
+    def __init__(self, message: str, *, _context: Optional[Dict[str, Any]] = None, **context: Any) -> None:
         """Initialize with message and optional context.
 
         Args:
             message: The error message
+            _context: Context dict already populated by a subclass
             **context: Additional context about the error
         """
         super().__init__(message)
-        self.context = context
+        self.context = _merge_context(_context, context)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Support pickling and copying.
+
+        Subclass ``__init__`` signatures differ from ``args``, so instances
+        are rebuilt without calling ``__init__`` and their slot values are
+        restored as state.
+        """
+        state = dict(self.__dict__)
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return _rebuild, (type(self), self.args), state
 
 
 class ValidationError(TypeSystemError):
     """Raised when a value fails validation."""
 
+    __slots__ = ("value",)
+
     value: Any
 
-    def __init__(self, message: str, value: Any, **context: Any) -> None:
+    def __init__(self, message: str, value: Any, *, _context: Optional[Dict[str, Any]] = None, **context: Any) -> None:
         """Initialize with invalid value information.
 
         Args:
             message: The validation error message
             value: The invalid value
+            _context: Context dict already populated by a subclass
             **context: Additional validation context
         """
-        super().__init__(message, value=value, **context)
+        ctx = _merge_context(_context, context)
+        ctx["value"] = value
+        super().__init__(message, _context=ctx)
         self.value = value
 
 
 class ConversionError(TypeSystemError):
     """Raised when a value cannot be converted to the target type."""
 
+    __slots__ = ("value", "target_type")
+
     value: Any
     target_type: type
 
-    def __init__(self, message: str, value: Any, target_type: type, **context: Any) -> None:
+    def __init__(
+        self, message: str, value: Any, target_type: type, *, _context: Optional[Dict[str, Any]] = None, **context: Any
+    ) -> None:
         """Initialize with conversion details.
 
         Args:
             message: The conversion error message
             value: The value that couldn't be converted
             target_type: The type we tried to convert to
+            _context: Context dict already populated by a subclass
             **context: Additional conversion context
         """
-        super().__init__(message, value=value, target_type=target_type, **context)
+        ctx = _merge_context(_context, context)
+        ctx["value"] = value
+        ctx["target_type"] = target_type
+        super().__init__(message, _context=ctx)
         self.value = value
         self.target_type = target_type
 
@@ -64,23 +114,30 @@ class ConversionError(TypeSystemError):
 class OperationError(TypeSystemError):
     """Raised when an operation cannot be performed."""
 
+    __slots__ = ("operation",)
+
     operation: str
 
-    def __init__(self, message: str, operation: str, **context: Any) -> None:
+    def __init__(self, message: str, operation: str, *, _context: Optional[Dict[str, Any]] = None, **context: Any) -> None:
         """Initialize with operation details.
 
         Args:
             message: The operation error message
             operation: The name of the failed operation
+            _context: Context dict already populated by a subclass
             **context: Additional operation context
         """
-        super().__init__(message, operation=operation, **context)
+        ctx = _merge_context(_context, context)
+        ctx["operation"] = operation
+        super().__init__(message, _context=ctx)
         self.operation = operation
 
 
 class ImmutabilityError(OperationError):
     """Raised when attempting to modify an immutable value."""
 
+    __slots__ = ("attribute",)
+
     attribute: str
 
     def __init__(self, message: str, attribute: str, **context: Any) -> None:
@@ -91,28 +148,45 @@ class ImmutabilityError(OperationError):
             attribute: The attribute that was attempted to be modified
             **context: Additional context
         """
-        super().__init__(message, operation="modify", attribute=attribute, **context)
+        context["attribute"] = attribute
+        super().__init__(message, "modify", _context=context)
         self.attribute = attribute
 
 
 # Integer-specific exceptions
+#
+# These are raised on hot validation paths where callers often catch and
+# discard them, so their messages are formatted lazily in __str__ from the
+# stored operands. ``args[0]`` is empty; use ``str(exc)`` for the message.
 class IntegerValidationError(ValidationError):
     """Raised when a value cannot be validated as an integer."""
 
-    def __init__(self, value: Any, **context: Any) -> None:
+    __slots__ = ("template",)
+
+    template: str
+
+    def __init__(self, value: Any, template: str = "Invalid value: {value}", **context: Any) -> None:
         """Initialize with invalid integer value.
 
         Args:
             value: The invalid value
+            template: Message template, formatted with ``value`` and
+                ``type_name`` (the name of the value's type) when displayed
             **context: Additional validation context
         """
-        message = f"Invalid value: {value}"
-        super().__init__(message, value, **context)
+        super().__init__("", value, _context=context)
+        self.template = template
+
+    def __str__(self) -> str:
+        """Format the error message."""
+        return self.template.format(value=self.value, type_name=type(self.value).__name__)
 
 
 class IntegerConversionError(ConversionError):
     """Raised when a value cannot be converted to an integer."""
 
+    __slots__ = ()
+
     def __init__(self, value: Any, **context: Any) -> None:
         """Initialize with conversion details.
 
@@ -120,28 +194,48 @@ class IntegerConversionError(ConversionError):
             value: The value that couldn't be converted
             **context: Additional conversion context
         """
-        message = f"Cannot convert '{value}' to integer"
-        super().__init__(message, value, int, **context)
+        super().__init__("", value, int, _context=context)
+
+    def __str__(self) -> str:
+        """Format the error message."""
+        return f"Cannot convert '{self.value}' to integer"
 
 
 class IntegerOperationError(OperationError):
     """Raised when an integer operation cannot be performed."""
 
-    def __init__(self, operation: str, left: Any, right: Any, **context: Any) -> None:
+    __slots__ = ("left", "right")
+
+    left: Any
+    right: Any
+
+    def __init__(
+        self, operation: str, left: Any, right: Any, *, _context: Optional[Dict[str, Any]] = None, **context: Any
+    ) -> None:
         """Initialize with operation details."""
-        message = f"Cannot perform {operation} between {left} and {right}"
-        super().__init__(operation=operation, left=left, right=right, message=message)
+        ctx = _merge_context(_context, context)
+        ctx["left"] = left
+        ctx["right"] = right
+        super().__init__("", operation, _context=ctx)
+        self.left = left
+        self.right = right
+
+    def __str__(self) -> str:
+        """Format the error message."""
+        return f"Cannot perform {self.operation} between {self.left} and {self.right}"
 
 
 class IntegerOverflowError(IntegerOperationError):
     """Raised when an integer operation would result in overflow."""
 
+    __slots__ = ("result",)
+
+    result: Any
+
     def __init__(self, operation: str, result: Any, **context: Any) -> None:
         """Initialize with overflow details."""
-        message = f"Operation {operation} would overflow: {result}"
-        super().__init__(
-            operation=operation,
-            left=context.pop('left'),
-            right=context.pop('right'),
-            message=message
-        )
+        left = context.pop("left")
+        right = context.pop("right")
+        context["result"] = result
+        super().__init__(operation, left, right, _context=context)
+        self.result = result
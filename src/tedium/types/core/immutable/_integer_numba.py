@@ -0,0 +1,34 @@
+"""Numba kernels for bulk Integer arithmetic.
+
+This module requires Numba and is only imported on demand by
+Integer.batch_add, which falls back to plain NumPy when the import fails.
+Kernels are compiled on first use and cached on disk.
+"""
+
+from typing import Any
+
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def add_many(a: Any, b: Any, out: Any) -> int:
+    """Add two int64 arrays element-wise into ``out``.
+
+    int64 addition wraps in compiled code, so each sum is checked for
+    overflow in the same pass.
+
+    Args:
+        a: One-dimensional int64 array
+        b: One-dimensional int64 array of the same length
+        out: int64 array receiving the sums
+
+    Returns:
+        The number of sums that overflowed
+    """
+    overflowed = 0
+    for i in prange(a.shape[0]):
+        r = a[i] + b[i]
+        out[i] = r
+        if ((a[i] ^ r) & (b[i] ^ r)) < 0:
+            overflowed += 1
+    return overflowed
@@ -4,14 +4,24 @@ This module provides an immutable Integer type that wraps Python's int type,
 adding validation and type safety.
 """
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Hashable, Optional, Type, cast
 
-from ..base import BaseType
+from ..base import BaseType, _store
 from tedium.types.core.exceptions import (
     IntegerValidationError,
     IntegerOverflowError,
 )
 
+# Validation message templates, formatted only when an error is displayed
+_NONE_MESSAGE = "Value cannot be None"
+_TYPE_MESSAGE = "Must be an integer, got {type_name} '{value}'"
+_EMPTY_MESSAGE = "Empty string"
+
+# Signed 64-bit range enforced by arithmetic operations
+_INT64_MAX = (1 << 63) - 1
+_INT64_MIN = -(1 << 63)
+
 
 class Integer(BaseType[int]):
     """An immutable integer type.
@@ -21,26 +31,51 @@ class Integer(BaseType[int]):
     types return NotImplemented rather than raising exceptions.
     """
 
+    __slots__ = ()
+
+    _exact_type = int
+
+    def __new__(cls, value: int, *args: Any, **kwargs: Any) -> "Integer":
+        """Create an Integer, sharing instances for small values.
+
+        Like CPython's small int cache, plain Integers in [-5, 256] are
+        preallocated and returned as-is. Any other call gets a fresh instance
+        that __init__ validates and stores the value on, so subclass state set
+        in __init__ is available to validate().
+
+        Args:
+            value: An integer value.
+            *args: Ignored; extra arguments for a subclass __init__
+            **kwargs: Ignored; extra arguments for a subclass __init__
+        """
+        if cls is Integer and type(value) is int and _SMALL_MIN <= value <= _SMALL_MAX:
+            return _SMALL_INTEGERS[value - _SMALL_MIN]
+        return object.__new__(cls)
+
     def __init__(self, value: int) -> None:
         """Initialize an Integer with a value.
 
+        Shared small-value instances returned by __new__ are already
+        initialized and are left untouched.
+
         Args:
             value: An integer value.
 
         Raises:
             IntegerValidationError: If the value is not an integer
         """
-        if value is None:
-            raise IntegerValidationError("Value cannot be None")
-        if not isinstance(value, int):
-            raise IntegerValidationError(f"Must be an integer, got {type(value).__name__} '{value}'")
-
-        super().__init__(value)
+        if type(value) is int and _SMALL_MIN <= value <= _SMALL_MAX and self is _SMALL_INTEGERS[value - _SMALL_MIN]:
+            return
+        self.validate(value)
+        _store(self, value)
 
     @classmethod
     def from_str(cls, value: str) -> "Integer":
         """Create an Integer from a string.
 
+        Results are memoized, since equal inputs always produce equal,
+        immutable instances.
+
         Args:
             value: String representation of an integer
 
@@ -50,17 +85,15 @@ class Integer(BaseType[int]):
         Raises:
             IntegerValidationError: If the string is empty or invalid
         """
-        if not value.strip():
-            raise IntegerValidationError("Empty string")
-        try:
-            return cls(int(value))
-        except ValueError as e:
-            raise IntegerValidationError(value) from e
+        return _from_str(cast(Hashable, cls), value)
 
     @classmethod
     def from_float(cls, value: float) -> "Integer":
         """Create an Integer from a float.
 
+        Results are memoized, since equal inputs always produce equal,
+        immutable instances.
+
         Args:
             value: Float that represents a whole number
 
@@ -70,18 +103,23 @@ class Integer(BaseType[int]):
         Raises:
             IntegerValidationError: If the float is not a whole number
         """
-        if not value.is_integer():
-            raise IntegerValidationError(value)
-        return cls(int(value))
+        return _from_float(cast(Hashable, cls), value)
 
-    @property
-    def value(self) -> int:
-        """Get the underlying integer value.
+    @classmethod
+    def _from_parsed(cls, value: Any) -> "Integer":
+        """Wrap a freshly parsed value, reusing shared instances for small values.
+
+        Args:
+            value: The parsed value
 
         Returns:
-            int: The wrapped integer value.
+            Integer instance
         """
-        return self._value
+        if type(value) is cls._exact_type:
+            if cls is Integer and _SMALL_MIN <= value <= _SMALL_MAX:
+                return _SMALL_INTEGERS[value - _SMALL_MIN]
+            return cls._unsafe_new(value)
+        return cls(value)
 
     def __add__(self, other: Any) -> "Integer":
         """Add this Integer to another value.
@@ -99,13 +137,64 @@ class Integer(BaseType[int]):
         if not isinstance(other, Integer):
             return NotImplemented
 
+        # Python int addition cannot overflow, so the 64-bit range is enforced
+        # explicitly rather than by catching OverflowError.
+        result = self.value + other.value
+        if result > _INT64_MAX or result < _INT64_MIN:
+            raise IntegerOverflowError("add", result, left=self, right=other)
+        return Integer._unsafe_new(result)
+
+    @staticmethod
+    def batch_add(lefts: Any, rights: Any) -> Any:
+        """Add two sequences of integers element-wise.
+
+        This is the vectorized counterpart of ``__add__`` for bulk arithmetic
+        and requires NumPy. The sums are computed in a single int64 operation
+        and checked for overflow together. When Numba is installed, equal
+        length one-dimensional operands are added by a compiled kernel in one
+        parallel pass.
+
+        Args:
+            lefts: Integer-typed NumPy array, or a sequence of Integer
+            rights: Integer-typed NumPy array, or a sequence of Integer
+
+        Returns:
+            numpy.ndarray: The int64 sums
+
+        Raises:
+            ImportError: If NumPy is not installed
+            TypeError: If an array operand does not hold integers, or holds bools
+            ValueError: If sequence operands differ in length
+            IntegerOverflowError: If any sum would overflow
+        """
+        import numpy as np
+
         try:
-            result = self._value + other._value
-            if result > 2**63 - 1 or result < -(2**63):
-                raise IntegerOverflowError("add", result, left=self, right=other)
-            return Integer(result)
+            a = _as_int64_array(np, lefts)
+            b = _as_int64_array(np, rights)
         except OverflowError:
-            raise IntegerOverflowError("add", f"{self._value} + {other._value}", left=self, right=other)
+            # An Integer operand lies outside the int64 range. Add pairwise so
+            # that __add__ reports any overflow exactly as the scalar path does.
+            if len(lefts) != len(rights):
+                raise ValueError("batch_add operands must have the same length") from None
+            sums = [_as_integer(left) + _as_integer(right) for left, right in zip(lefts, rights)]
+            return np.array([total.value for total in sums], dtype=np.int64)
+        add_many = _numba_add_many()
+        if add_many is not None and a.ndim == 1 and a.shape == b.shape:
+            result = np.empty_like(a)
+            if not add_many(a, b, result):
+                return result
+        else:
+            result = np.add(a, b)
+        # int64 addition wraps; a sum overflowed iff its sign differs from
+        # the sign of both operands.
+        overflowed = ((a ^ result) & (b ^ result)) < 0
+        if overflowed.any():
+            i = np.unravel_index(np.argmax(overflowed), overflowed.shape)
+            a, b = np.broadcast_arrays(a, b)
+            left, right = int(a[i]), int(b[i])
+            raise IntegerOverflowError("add", left + right, left=Integer(left), right=Integer(right))
+        return result
 
     def __eq__(self, other: Any) -> bool:
         """Compare this Integer with another value for equality.
@@ -118,39 +207,35 @@ class Integer(BaseType[int]):
         """
         if not isinstance(other, Integer):
             return False
-        return self._value == other._value
+        return self.value == other.value
 
     def __lt__(self, other: Any) -> Any:
         """Compare if this Integer is less than another value."""
         if not isinstance(other, Integer):
             return NotImplemented
-        return self._value < other._value
+        return self.value < other.value
 
     def __gt__(self, other: Any) -> Any:
         """Compare if this Integer is greater than another value."""
         if not isinstance(other, Integer):
             return NotImplemented
-        return self._value > other._value
+        return self.value > other.value
 
     def __le__(self, other: Any) -> Any:
         """Compare if this Integer is less than or equal to another value."""
         if not isinstance(other, Integer):
             return NotImplemented
-        return self._value <= other._value
+        return self.value <= other.value
 
     def __ge__(self, other: Any) -> Any:
         """Compare if this Integer is greater than or equal to another value."""
         if not isinstance(other, Integer):
             return NotImplemented
-        return self._value >= other._value
+        return self.value >= other.value
 
-    def __hash__(self) -> int:
-        """Get hash value for use in sets and as dict keys.
-
-        Returns:
-            int: Hash of the wrapped value
-        """
-        return hash(self._value)
+    # Defining __eq__ would otherwise reset __hash__ to None; reuse the hash
+    # BaseType caches at construction.
+    __hash__ = BaseType.__hash__
 
     def __str__(self) -> str:
         """Get string representation of the integer value.
@@ -158,7 +243,7 @@ class Integer(BaseType[int]):
         Returns:
             str: The string representation of the wrapped integer.
         """
-        return str(self._value)
+        return str(self.value)
 
     def __repr__(self) -> str:
         """Get detailed string representation.
@@ -166,11 +251,77 @@ class Integer(BaseType[int]):
         Returns:
             str: A string in the format 'Integer(value)'.
         """
-        return f"Integer({self._value})"
+        return f"Integer({self.value})"
 
     def validate(self, value: int) -> None:
         """Validate integer values."""
         if value is None:
-            raise IntegerValidationError("Value cannot be None")
-        if not isinstance(value, int):
-            raise IntegerValidationError(f"Must be an integer, got {type(value).__name__} '{value}'")
+            raise IntegerValidationError(value, _NONE_MESSAGE)
+        if type(value) is not int:
+            raise IntegerValidationError(value, _TYPE_MESSAGE)
+
+
+# Bound on memoized conversions per function, so that parsing many distinct
+# inputs cannot grow memory without limit.
+_CONVERSION_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
+def _from_str(cls: Hashable, value: str) -> Integer:
+    """Parse a string into cls; backs Integer.from_str."""
+    integer_cls = cast(Type[Integer], cls)
+    if not value or value.isspace():
+        raise IntegerValidationError(value, _EMPTY_MESSAGE)
+    try:
+        return integer_cls._from_parsed(int(value))
+    except ValueError as e:
+        raise IntegerValidationError(value) from e
+
+
+@lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
+def _from_float(cls: Hashable, value: float) -> Integer:
+    """Convert a whole-number float into cls; backs Integer.from_float."""
+    if not value.is_integer():
+        raise IntegerValidationError(value)
+    return cast(Type[Integer], cls)._from_parsed(int(value))
+
+
+@lru_cache(maxsize=None)
+def _numba_add_many() -> Optional[Any]:
+    """Return the compiled batch add kernel, or None without Numba."""
+    try:
+        from ._integer_numba import add_many
+    except ImportError:
+        return None
+    return add_many
+
+
+def _as_int64_array(np: Any, values: Any) -> Any:
+    """Convert a batch_add operand to an int64 NumPy array.
+
+    Integer arrays are cast safely (without copying int64 input); bool arrays
+    are rejected, as Integer rejects bool. Any other operand is treated as a
+    sequence of Integer.
+
+    Raises:
+        TypeError: If an array operand does not hold integers
+        OverflowError: If an Integer lies outside the int64 range
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype == np.bool_:
+            raise TypeError("batch_add does not accept bool arrays")
+        return values.astype(np.int64, casting="safe", copy=False)
+    return np.array([v.value for v in values], dtype=np.int64)
+
+
+def _as_integer(value: Any) -> Integer:
+    """Wrap a batch_add element as an Integer for the scalar fallback."""
+    if isinstance(value, Integer):
+        return value
+    return Integer(int(value))
+
+
+# Shared instances for small values, returned by Integer.__new__
+_SMALL_MIN = -5
+_SMALL_MAX = 256
+_SMALL_INTEGERS = tuple(Integer._unsafe_new(v) for v in range(_SMALL_MIN, _SMALL_MAX + 1))
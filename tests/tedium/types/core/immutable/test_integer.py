@@ -1,10 +1,13 @@
 """Tests for the Integer immutable type implementation."""
 
-from typing import Any, Dict, List, Set
+import copy
+import pickle
+from typing import Any, Dict, List, Optional, Set
 
 import pytest
 
 from tedium.types.core.exceptions import (
+    ImmutabilityError,
     IntegerValidationError,
     IntegerOverflowError,
 )
@@ -26,6 +29,25 @@ def test_integer_basic_creation() -> None:
     assert i.value == -42
 
 
+def test_integer_small_value_cache() -> None:
+    """Test small values share instances without affecting subclasses."""
+    assert Integer(1) is Integer(1)
+    assert Integer(-5) is Integer(-5)
+    assert Integer(256) is Integer(256)
+
+    # Shared instances cannot be corrupted by deleting their state
+    with pytest.raises(ImmutabilityError):
+        del Integer(1).value
+    assert Integer(1).value == 1
+
+    class SubInteger(Integer):
+        __slots__ = ()
+
+    sub = SubInteger(1)
+    assert type(sub) is SubInteger
+    assert sub is not SubInteger(1)
+
+
 def test_integer_from_string() -> None:
     """Test creating Integer from valid string representations."""
     # Test positive integer string
@@ -70,7 +92,7 @@ def test_integer_from_float() -> None:
 def test_integer_validation_failures() -> None:
     """Test that invalid values raise appropriate exceptions."""
     # Test non-integer inputs using explicit Any typing
-    invalid_inputs: List[Any] = ["42", 42.0, []]
+    invalid_inputs: List[Any] = ["42", 42.0, [], True]
     for invalid_input in invalid_inputs:
         with pytest.raises(IntegerValidationError):
             Integer(invalid_input)
@@ -175,3 +197,93 @@ def test_integer_validation() -> None:
     with pytest.raises(IntegerValidationError) as exc_info:
         Integer("42")  # type: ignore
     assert "Must be an integer, got str '42'" in str(exc_info.value)
+    assert exc_info.value.value == "42"
+
+
+def test_integer_subclass_mixin_validation() -> None:
+    """Test conversions run validation inherited from a mixin."""
+
+    class PositiveMixin:
+        __slots__ = ()
+
+        def validate(self, value: int) -> None:
+            super().validate(value)  # type: ignore[misc]
+            if value <= 0:
+                raise IntegerValidationError(value, "Must be positive, got {value}")
+
+    class Positive(PositiveMixin, Integer):
+        __slots__ = ()
+
+    assert Positive.from_str("3") == Positive(3)
+    for convert in (lambda: Positive.from_json("-3"), lambda: Positive.from_str("-3"), lambda: Positive.from_float(-3.0)):
+        with pytest.raises(IntegerValidationError):
+            convert()
+
+
+def test_integer_subclass_init_arguments() -> None:
+    """Test subclasses can take extra constructor arguments used by validate."""
+
+    class BoundedInteger(Integer):
+        min_value: Optional[int]
+        max_value: Optional[int]
+
+        def __init__(self, value: int, min_value: Optional[int] = None, max_value: Optional[int] = None) -> None:
+            object.__setattr__(self, "min_value", min_value)
+            object.__setattr__(self, "max_value", max_value)
+            super().__init__(value)
+
+        def validate(self, value: int) -> None:
+            super().validate(value)
+            if self.min_value is not None and value < self.min_value:
+                raise IntegerValidationError(value, "Value {value} is less than minimum", min_value=self.min_value)
+            if self.max_value is not None and value > self.max_value:
+                raise IntegerValidationError(value, "Value {value} is greater than maximum", max_value=self.max_value)
+
+    port = BoundedInteger(8080, min_value=1, max_value=65535)
+    assert port == Integer(8080)
+    assert type(BoundedInteger(1, 0)) is BoundedInteger
+
+    with pytest.raises(IntegerValidationError) as exc_info:
+        BoundedInteger(-1, min_value=0)
+    assert str(exc_info.value) == "Value -1 is less than minimum"
+    assert exc_info.value.context == {"value": -1, "min_value": 0}
+
+
+def test_integer_copy_and_pickle() -> None:
+    """Test slotted Integer instances copy and pickle correctly."""
+    i = Integer(42)
+    assert not hasattr(i, "__dict__")
+
+    assert copy.copy(i) == i
+    assert copy.deepcopy(i) == i
+    assert pickle.loads(pickle.dumps(i)) == i
+
+
+def test_integer_batch_add() -> None:
+    """Test vectorized addition of many integers."""
+    np = pytest.importorskip("numpy")
+
+    result = Integer.batch_add(np.array([1, -2, 3]), [Integer(10), Integer(20), Integer(30)])
+    assert result.tolist() == [11, 18, 33]
+
+    with pytest.raises(IntegerOverflowError):
+        Integer.batch_add(np.array([2**63 - 1, 0]), np.array([1, 0]))
+    with pytest.raises(IntegerOverflowError):
+        Integer.batch_add(np.array([-(2**63)]), np.array([-1]))
+    with pytest.raises(TypeError):
+        Integer.batch_add(np.array([1.5]), np.array([1]))
+    with pytest.raises(TypeError):
+        Integer.batch_add(np.array([True]), np.array([1]))
+
+    # Overflow is reported for broadcast and multi-dimensional operands
+    with pytest.raises(IntegerOverflowError) as exc_info:
+        Integer.batch_add(np.array([0, 0, 2**63 - 1]), np.array([1]))
+    assert exc_info.value.left == Integer(2**63 - 1)
+    assert exc_info.value.right == Integer(1)
+    with pytest.raises(IntegerOverflowError):
+        Integer.batch_add(np.array([[0, 0], [0, 2**63 - 1]]), np.array([[0, 0], [0, 1]]))
+
+    # Integers outside the int64 range follow the scalar semantics
+    with pytest.raises(IntegerOverflowError):
+        Integer.batch_add([Integer(2**64)], [Integer(0)])
+    assert Integer.batch_add([Integer(2**64)], [Integer(-(2**64) + 5)]).tolist() == [5]
@@ -1,7 +1,10 @@
 """Tests for the BaseType class."""
 
 import copy
-from typing import Dict, Set
+import math
+import pickle
+import weakref
+from typing import Any, Dict, List, Set
 
 import pytest
 
@@ -16,6 +19,8 @@ from tedium.types.core.exceptions import (
 class StringType(BaseType[str]):
     """Simple string type for testing base functionality."""
 
+    _exact_type = str
+
     def validate(self, value: str) -> None:
         """Validate string values."""
         super().validate(value)
@@ -23,9 +28,21 @@ class StringType(BaseType[str]):
             raise ValidationError("Must be a string", value=value)
 
 
+class NonEmptyString(StringType):
+    """String type with an extra validation rule."""
+
+    def validate(self, value: str) -> None:
+        """Validate non-empty string values."""
+        super().validate(value)
+        if not value:
+            raise ValidationError("Must not be empty", value=value)
+
+
 class ComparableInt(ComparableType[int]):
     """Simple integer type for testing comparison operations."""
 
+    __slots__ = ()
+
     def validate(self, value: int) -> None:
         """Validate integer values."""
         super().validate(value)
@@ -33,13 +50,43 @@ class ComparableInt(ComparableType[int]):
             raise ValidationError("Must be an integer", value=value)
 
 
+class ListType(BaseType[List[Any]]):
+    """Unhashable value type for testing hash behavior."""
+
+    __slots__ = ()
+
+    def validate(self, value: List[Any]) -> None:
+        """Validate list values."""
+        super().validate(value)
+        if not isinstance(value, list):
+            raise ValidationError("Must be a list", value=value)
+
+
+class Tagged(BaseType[int]):
+    """Value type whose constructor takes an extra required argument."""
+
+    unit: str
+
+    def __init__(self, value: int, unit: str) -> None:
+        object.__setattr__(self, "unit", unit)
+        super().__init__(value)
+
+
 def test_base_functionality() -> None:
     """Test core functionality through MinimalType."""
     t = StringType("test")
 
     # Test immutability
     with pytest.raises(ImmutabilityError):
-        t._value = "new"
+        t._value = "new"  # type: ignore[misc]
+    with pytest.raises(ImmutabilityError):
+        t.value = "new"
+    with pytest.raises(ImmutabilityError):
+        del t.value
+    with pytest.raises(ImmutabilityError):
+        del t._hash
+    assert t.value == "test"
+    assert t._value == "test"
 
     # Test string conversion
     assert str(t) == "test"
@@ -96,6 +143,48 @@ def test_json_operations() -> None:
     assert "Invalid JSON string" in str(exc_info.value)
 
 
+def test_json_exact_type_fast_path() -> None:
+    """Test subclasses that change validation still validate parsed JSON."""
+    assert StringType.from_json('""') == StringType("")
+    with pytest.raises(ValidationError):
+        NonEmptyString.from_json('""')
+    with pytest.raises(ValidationError):
+        StringType.from_json("42")
+
+
+def test_json_exact_type_fast_path_with_mixin() -> None:
+    """Test validation inherited from a mixin also disables the fast path."""
+
+    class NonBlankMixin:
+        __slots__ = ()
+
+        def validate(self, value: str) -> None:
+            super().validate(value)  # type: ignore[misc]
+            if not value.strip():
+                raise ValidationError("Must not be blank", value=value)
+
+    class NonBlankString(NonBlankMixin, StringType):
+        pass
+
+    assert NonBlankString.from_json('"a"') == NonBlankString("a")
+    with pytest.raises(ValidationError):
+        NonBlankString.from_json('" "')
+
+
+def test_json_wide_values() -> None:
+    """Test JSON round-trips of values outside the fast backend's range."""
+    big = ComparableInt(2**70)
+    assert big.to_json() == str(2**70)
+    assert ComparableInt.from_json(big.to_json()) == big
+
+    # Nested values take the same path as top-level ones
+    assert ListType([2**70]).to_json() == f"[{2**70}]"
+    assert ListType.from_json(f"[{2**70}]") == ListType([2**70])
+    nested_nan = ListType([float("nan")]).to_json()
+    assert nested_nan == "[NaN]"
+    assert math.isnan(ListType.from_json(nested_nan).value[0])
+
+
 def test_copy_operations() -> None:
     """Test copy behavior."""
     original = StringType("test")
@@ -167,3 +256,26 @@ def test_hash_behavior() -> None:
     # Set operations
     s: Set[ComparableInt] = {t1, t2, t3}
     assert len(s) == 2     # t1 and t2 collapse to one entry
+
+
+def test_slots_and_pickle() -> None:
+    """Test slotted instances have no __dict__, allow weak references and pickle."""
+    t = ComparableInt(1)
+    assert not hasattr(t, "__dict__")
+
+    restored = pickle.loads(pickle.dumps(t))
+    assert restored == t
+    assert restored is not t
+    assert weakref.ref(t)() is t
+
+    tagged = pickle.loads(pickle.dumps(Tagged(5, "ms")))
+    assert tagged.value == 5
+    assert tagged.unit == "ms"
+
+
+def test_unhashable_value() -> None:
+    """Test unhashable values can be wrapped but not hashed."""
+    t = ListType([1, 2])
+    assert t.value == [1, 2]
+    with pytest.raises(TypeError):
+        hash(t)
@@ -1,11 +1,17 @@
 """Tests for core type system exceptions."""
 
+import copy
+import pickle
+
 from tedium.types.core.exceptions import (
     TypeSystemError,
     ValidationError,
     ConversionError,
     OperationError,
     ImmutabilityError,
+    IntegerValidationError,
+    IntegerOperationError,
+    IntegerOverflowError,
 )
 
 
@@ -50,6 +56,51 @@ def test_immutability_error() -> None:
     assert error.context == {"operation": "modify", "attribute": "value"}
 
 
+def test_integer_operation_error_context() -> None:
+    """Test integer operation errors keep operands and extra context."""
+    error = IntegerOperationError("add", 1, "x", hint="types")
+    assert error.operation == "add"
+    assert error.context == {"operation": "add", "left": 1, "right": "x", "hint": "types"}
+
+    overflow = IntegerOverflowError("add", 2**64, left=2**63, right=2**63)
+    assert isinstance(overflow, IntegerOperationError)
+    assert overflow.context == {"operation": "add", "left": 2**63, "right": 2**63, "result": 2**64}
+
+
+def test_integer_error_messages() -> None:
+    """Test integer error messages are formatted from stored operands."""
+    error = IntegerValidationError("abc")
+    assert str(error) == "Invalid value: abc"
+    assert error.args == ("",)
+
+    error = IntegerValidationError(4.5, "Must be an integer, got {type_name} '{value}'")
+    assert str(error) == "Must be an integer, got float '4.5'"
+    assert error.value == 4.5
+
+    op_error = IntegerOperationError("add", 1, 2)
+    assert str(op_error) == "Cannot perform add between 1 and 2"
+
+
+def test_exception_pickle_and_copy() -> None:
+    """Test that pickling and copying keep the exception state."""
+    errors = [
+        TypeSystemError("test error", key="value"),
+        ImmutabilityError("cannot modify", attribute="value"),
+        IntegerValidationError(1.5, template="Expected int, got {type_name}"),
+        IntegerOverflowError("add", 2**63, left=2**63 - 1, right=1),
+    ]
+    for error in errors:
+        for clone in (pickle.loads(pickle.dumps(error)), copy.copy(error), copy.deepcopy(error)):
+            assert type(clone) is type(error)
+            assert str(clone) == str(error)
+            assert clone.args == error.args
+            assert clone.context == error.context
+
+    overflow = pickle.loads(pickle.dumps(errors[-1]))
+    assert isinstance(overflow, IntegerOverflowError)
+    assert (overflow.operation, overflow.left, overflow.right, overflow.result) == ("add", 2**63 - 1, 1, 2**63)
+
+
 def test_exception_hierarchy() -> None:
     """Test exception inheritance relationships."""
     # All exceptions inherit from TypeSystemError